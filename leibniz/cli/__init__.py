@@ -1,6 +1,7 @@
 """Command-line interface for Leibniz."""
 
 import socket
+from contextlib import suppress
 from pathlib import Path
 
 import typer
@@ -17,6 +18,69 @@ app = typer.Typer(
 )
 console = Console()
 
+# Connect timeout for each service connectivity probe
+PROBE_TIMEOUT_S = 1.0
+
+
+async def _probe(address: str, port: int) -> bool:
+    """Return whether a TCP connection to ``address:port`` can be opened."""
+    import asyncio
+
+    try:
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(address, port), timeout=PROBE_TIMEOUT_S
+        )
+    except (OSError, TimeoutError):
+        return False
+
+    # The service accepted the connection; a reset while closing is irrelevant
+    with suppress(OSError):
+        writer.close()
+        await writer.wait_closed()
+    return True
+
+
+async def _probe_all(targets: list[tuple[str, int]]) -> list[bool]:
+    """Probe all ``(address, port)`` targets concurrently."""
+    import asyncio
+
+    return await asyncio.gather(*(_probe(address, port) for address, port in targets))
+
+
+def _resolve_hosts(
+    services: list[tuple[str, str, int]],
+) -> tuple[dict[str, str], dict[str, socket.gaierror]]:
+    """Resolve each distinct service host once.
+
+    Returns the addresses of resolved hosts and the lookup error of the rest.
+    """
+    resolved: dict[str, str] = {}
+    failed: dict[str, socket.gaierror] = {}
+    for host in dict.fromkeys(host for _, host, _ in services):
+        try:
+            resolved[host] = socket.gethostbyname(host)
+        except socket.gaierror as e:
+            failed[host] = e
+    return resolved, failed
+
+
+def _check_services(services: list[tuple[str, str, int]]) -> None:
+    """Probe all services concurrently and report their accessibility in order."""
+    # asyncio is only needed here, so keep it out of CLI startup
+    import asyncio
+
+    resolved, failed = _resolve_hosts(services)
+    targets = [(resolved[host], port) for _, host, port in services if host in resolved]
+    results = iter(asyncio.run(_probe_all(targets)))
+
+    for name, host, port in services:
+        if host in failed:
+            console.print(f"[red]✗[/red] {name} check failed: {failed[host]}")
+        elif next(results):
+            console.print(f"[green]✓[/green] {name} is accessible on port {port}")
+        else:
+            console.print(f"[red]✗[/red] {name} is not accessible on port {port}")
+
 
 @app.command()
 def info() -> None:
@@ -110,19 +174,7 @@ def check() -> None:
         ("GROBID", "localhost", 8070),
     ]
 
-    for name, host, port in services:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(1)
-        try:
-            result = sock.connect_ex((host, port))
-            if result == 0:
-                console.print(f"[green]✓[/green] {name} is accessible on port {port}")
-            else:
-                console.print(f"[red]✗[/red] {name} is not accessible on port {port}")
-        except (TimeoutError, socket.gaierror) as e:
-            console.print(f"[red]✗[/red] {name} check failed: {e}")
-        finally:
-            sock.close()
+    _check_services(services)
 
 
 if __name__ == "__main__":
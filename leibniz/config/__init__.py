@@ -1,10 +1,12 @@
 """Configuration management with security separation."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from pydantic import Field
-from pydantic_settings import BaseSettings
+if TYPE_CHECKING:
+    from leibniz.config.settings import Settings
 
 
 class ServiceDefaults:
@@ -59,9 +61,7 @@ class XDGPaths:
         self.logs_dir = self.state_dir / "logs"
         self.metrics_dir = self.state_dir / "metrics"
 
-    def ensure_directories(self) -> None:
-        """Create all required directories."""
-        dirs = [
+        self.directories = (
             self.config_dir,
             self.data_dir,
             self.cache_dir,
@@ -71,47 +71,20 @@ class XDGPaths:
             self.embeddings_dir,
             self.logs_dir,
             self.metrics_dir,
-        ]
-        for path in dirs:
-            path.mkdir(parents=True, exist_ok=True)
-
-
-class Settings(BaseSettings):
-    """Application settings loaded from environment variables."""
-
-    # API Keys - loaded from environment only
-    openai_api_key: str = Field(default="", alias="LEIBNIZ_OPENAI_API_KEY")
-
-    # Service configurations - loaded from environment
-    redis_url: str = Field(default="redis://localhost:6379", alias="LEIBNIZ_REDIS_URL")
-    neo4j_uri: str = Field(default="bolt://localhost:7687", alias="LEIBNIZ_NEO4J_URI")
-    neo4j_user: str = Field(default="neo4j", alias="LEIBNIZ_NEO4J_USER")
-    neo4j_password: str = Field(default="", alias="LEIBNIZ_NEO4J_PASSWORD")
-    qdrant_host: str = Field(default="localhost", alias="LEIBNIZ_QDRANT_HOST")
-    qdrant_port: int = Field(default=6333, alias="LEIBNIZ_QDRANT_PORT")
-    meilisearch_host: str = Field(
-        default="http://localhost:7700", alias="LEIBNIZ_MEILISEARCH_HOST"
-    )
-    meilisearch_key: str = Field(default="", alias="LEIBNIZ_MEILISEARCH_KEY")
-    grobid_host: str = Field(
-        default="http://localhost:8070", alias="LEIBNIZ_GROBID_HOST"
-    )
-
-    # Performance settings
-    query_timeout_ms: int = Field(default=200, alias="LEIBNIZ_QUERY_TIMEOUT_MS")
-    cache_ttl_seconds: int = Field(default=3600, alias="LEIBNIZ_CACHE_TTL_SECONDS")
-    max_workers: int = Field(default=8, alias="LEIBNIZ_MAX_WORKERS")
-    batch_size: int = Field(default=100, alias="LEIBNIZ_BATCH_SIZE")
+        )
+        self._ensured = False
 
-    # Development settings
-    debug: bool = Field(default=False, alias="LEIBNIZ_DEBUG")
-    log_level: str = Field(default="INFO", alias="LEIBNIZ_LOG_LEVEL")
-
-    class Config:
-        """Pydantic configuration."""
+    def ensure_directories(self) -> None:
+        """Create all required directories (once per instance)."""
+        if self._ensured:
+            return
+        for path in self.directories:
+            path.mkdir(parents=True, exist_ok=True)
+        self._ensured = True
 
-        env_file = ".env"
-        case_sensitive = False
+    def reset(self) -> None:
+        """Forget that directories were created (useful for testing)."""
+        self._ensured = False
 
 
 # Create singleton instances
@@ -119,30 +92,30 @@ paths = XDGPaths()
 defaults = ServiceDefaults()
 
 
-class _SettingsCache:
-    """Cache for settings instance to avoid global variable."""
-
-    def __init__(self) -> None:
-        self._settings: Settings | None = None
+def __getattr__(name: str) -> type["Settings"]:
+    """Import ``Settings`` on first access.
 
-    def get(self) -> Settings:
-        """Get cached settings or create new instance."""
-        if self._settings is None:
-            self._settings = Settings()
-        return self._settings
+    Loading pydantic-settings dominates import time, so it is deferred until a
+    command actually needs configuration.
+    """
+    if name == "Settings":
+        from leibniz.config.settings import Settings
 
-    def reset(self) -> None:
-        """Reset cached settings (useful for testing)."""
-        self._settings = None
+        return Settings
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
 
 
-# Use a class to avoid global variable
-_cache = _SettingsCache()
+@lru_cache(maxsize=1)
+def get_settings() -> "Settings":
+    """Get settings instance, creating if needed.
 
+    Use ``get_settings.cache_clear()`` to reset the cached instance (useful for
+    testing).
+    """
+    from leibniz.config.settings import Settings
 
-def get_settings() -> Settings:
-    """Get settings instance, creating if needed."""
-    return _cache.get()
+    return Settings()
 
 
 # Export public interface
@@ -0,0 +1,42 @@
+"""Application settings model."""
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class Settings(BaseSettings):
+    """Application settings loaded from environment variables."""
+
+    # API Keys - loaded from environment only
+    openai_api_key: str = Field(default="", alias="LEIBNIZ_OPENAI_API_KEY")
+
+    # Service configurations - loaded from environment
+    redis_url: str = Field(default="redis://localhost:6379", alias="LEIBNIZ_REDIS_URL")
+    neo4j_uri: str = Field(default="bolt://localhost:7687", alias="LEIBNIZ_NEO4J_URI")
+    neo4j_user: str = Field(default="neo4j", alias="LEIBNIZ_NEO4J_USER")
+    neo4j_password: str = Field(default="", alias="LEIBNIZ_NEO4J_PASSWORD")
+    qdrant_host: str = Field(default="localhost", alias="LEIBNIZ_QDRANT_HOST")
+    qdrant_port: int = Field(default=6333, alias="LEIBNIZ_QDRANT_PORT")
+    meilisearch_host: str = Field(
+        default="http://localhost:7700", alias="LEIBNIZ_MEILISEARCH_HOST"
+    )
+    meilisearch_key: str = Field(default="", alias="LEIBNIZ_MEILISEARCH_KEY")
+    grobid_host: str = Field(
+        default="http://localhost:8070", alias="LEIBNIZ_GROBID_HOST"
+    )
+
+    # Performance settings
+    query_timeout_ms: int = Field(default=200, alias="LEIBNIZ_QUERY_TIMEOUT_MS")
+    cache_ttl_seconds: int = Field(default=3600, alias="LEIBNIZ_CACHE_TTL_SECONDS")
+    max_workers: int = Field(default=8, alias="LEIBNIZ_MAX_WORKERS")
+    batch_size: int = Field(default=100, alias="LEIBNIZ_BATCH_SIZE")
+
+    # Development settings
+    debug: bool = Field(default=False, alias="LEIBNIZ_DEBUG")
+    log_level: str = Field(default="INFO", alias="LEIBNIZ_LOG_LEVEL")
+
+    class Config:
+        """Pydantic configuration."""
+
+        env_file = ".env"
+        case_sensitive = False
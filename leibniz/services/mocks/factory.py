@@ -1,6 +1,12 @@
-"""Factory for creating mock or real service clients."""
+"""Factory for creating mock or real service clients.
+
+In mock mode, getters share one mock per keyword-argument combination; calls
+with unhashable kwargs get a fresh mock. Real clients are never cached. Use
+``reset_clients()`` to drop the shared mocks.
+"""
 # ruff: noqa: ANN401
 
+import importlib
 import os
 from typing import Any
 
@@ -18,69 +24,96 @@ USE_MOCKS = (
 )
 
 
-def get_redis_client(**kwargs: Any) -> Any:
-    """Get Redis client (mock or real)."""
+def _optional_import(module: str, attr: str | None = None) -> Any:
+    """Import a client library once; None means the getter returns a mock."""
     if USE_MOCKS:
-        return RedisMock()
+        return None
     try:
-        import redis
+        imported = importlib.import_module(module)
+        return getattr(imported, attr) if attr else imported
+    except Exception:  # noqa: BLE001
+        return None
+
+
+_redis = _optional_import("redis")
+_AsyncGraphDatabase = _optional_import("neo4j", "AsyncGraphDatabase")
+_QdrantClient = _optional_import("qdrant_client", "QdrantClient")
+_meilisearch = _optional_import("meilisearch")
+_AsyncOpenAI = _optional_import("openai", "AsyncOpenAI")
+
+_mock_cache: dict[tuple[type, frozenset[tuple[str, Any]]], Any] = {}
 
-        return redis.Redis(**kwargs)
+
+def _shared_mock(mock_cls: type, kwargs: dict[str, Any], **init_kwargs: Any) -> Any:
+    """Return the shared ``mock_cls`` instance for ``kwargs``.
+
+    Unhashable kwargs cannot be cached, so they get a fresh instance.
+    """
+    try:
+        key = (mock_cls, frozenset(kwargs.items()))
+        mock = _mock_cache.get(key)
+    except TypeError:
+        return mock_cls(**init_kwargs)
+    if mock is None:
+        mock = _mock_cache[key] = mock_cls(**init_kwargs)
+    return mock
+
+
+def get_redis_client(**kwargs: Any) -> Any:
+    """Get Redis client (mock or real)."""
+    if _redis is None:
+        return _shared_mock(RedisMock, kwargs)
+    try:
+        return _redis.Redis(**kwargs)
     except Exception:  # noqa: BLE001
         return RedisMock()
 
 
 def get_neo4j_driver(**kwargs: Any) -> Any:
     """Get Neo4j driver (mock or real)."""
-    if USE_MOCKS:
-        return Neo4jDriverMock()
+    if _AsyncGraphDatabase is None:
+        return _shared_mock(Neo4jDriverMock, kwargs)
     try:
-        from neo4j import AsyncGraphDatabase
-
-        return AsyncGraphDatabase.driver(**kwargs)
+        return _AsyncGraphDatabase.driver(**kwargs)
     except Exception:  # noqa: BLE001
         return Neo4jDriverMock()
 
 
 def get_qdrant_client(**kwargs: Any) -> Any:
     """Get QDrant client (mock or real)."""
-    if USE_MOCKS:
-        return QdrantMock()
+    if _QdrantClient is None:
+        return _shared_mock(QdrantMock, kwargs)
     try:
-        from qdrant_client import QdrantClient
-
-        return QdrantClient(**kwargs)
+        return _QdrantClient(**kwargs)
     except Exception:  # noqa: BLE001
         return QdrantMock()
 
 
 def get_meilisearch_client(**kwargs: Any) -> Any:
     """Get Meilisearch client (mock or real)."""
-    if USE_MOCKS:
-        return MeilisearchMock()
+    if _meilisearch is None:
+        return _shared_mock(MeilisearchMock, kwargs)
     try:
-        import meilisearch
-
-        return meilisearch.Client(**kwargs)
+        return _meilisearch.Client(**kwargs)
     except Exception:  # noqa: BLE001
         return MeilisearchMock()
 
 
 def get_openai_client(**kwargs: Any) -> Any:
     """Get OpenAI client (mock or real)."""
-    if USE_MOCKS:
-        return OpenAIMock()
+    if _AsyncOpenAI is None:
+        return _shared_mock(OpenAIMock, kwargs)
     try:
-        from openai import AsyncOpenAI
-
-        return AsyncOpenAI(**kwargs)
+        return _AsyncOpenAI(**kwargs)
     except Exception:  # noqa: BLE001
         return OpenAIMock()
 
 
 def get_grobid_client(**kwargs: Any) -> Any:
     """Get GROBID client (mock or real)."""
-    if USE_MOCKS:
-        return GrobidMock(**kwargs)
+    return _shared_mock(GrobidMock, kwargs, **kwargs)
+
 
-    return GrobidMock(**kwargs)
+def reset_clients() -> None:
+    """Drop all shared mocks so the next getter call builds a fresh one."""
+    _mock_cache.clear()
@@ -13,7 +13,7 @@ class TestDataGenerator:
     """Generate realistic test data."""
 
     def __init__(self) -> None:
-        self.methods = [
+        self.methods = (
             "BERT",
             "GPT",
             "ViT",
@@ -22,10 +22,10 @@ class TestDataGenerator:
             "CLIP",
             "DeiT",
             "Swin",
-        ]
-        self.datasets = ["ImageNet", "COCO", "SQuAD", "GLUE", "WikiText", "CIFAR-10"]
-        self.metrics = ["accuracy", "F1", "perplexity", "mAP", "BLEU", "FID"]
-        self.venues = ["ICLR", "NeurIPS", "ICML", "CVPR", "ACL", "EMNLP"]
+        )
+        self.datasets = ("ImageNet", "COCO", "SQuAD", "GLUE", "WikiText", "CIFAR-10")
+        self.metrics = ("accuracy", "F1", "perplexity", "mAP", "BLEU", "FID")
+        self.venues = ("ICLR", "NeurIPS", "ICML", "CVPR", "ACL", "EMNLP")
 
     def generate_paper(self, paper_id: int) -> dict[str, Any]:
         """Generate a realistic paper."""
@@ -44,15 +44,18 @@ class TestDataGenerator:
 
     def _generate_abstract(self, method: str, dataset: str) -> str:
         """Generate realistic abstract."""
-        templates = [
-            f"We propose improvements to {method} that achieve state-of-the-art results on {dataset}. "
-            f"Our approach combines {fake.word()} attention with {fake.word()} regularization. "
-            f"Experiments show {random.randint(2, 10)}% improvement over baselines.",
+        # Pick the template first so only its Faker words are generated
+        if random.getrandbits(1):
+            return (
+                f"We propose improvements to {method} that achieve state-of-the-art results on {dataset}. "
+                f"Our approach combines {fake.word()} attention with {fake.word()} regularization. "
+                f"Experiments show {random.randint(2, 10)}% improvement over baselines."
+            )
+        return (
             f"This paper introduces {fake.word()}-{method}, a novel variant achieving "
             f"{random.uniform(85, 99):.1f}% accuracy on {dataset}. "
-            f"Key innovations include {fake.word()} pooling and {fake.word()} normalization.",
-        ]
-        return random.choice(templates)
+            f"Key innovations include {fake.word()} pooling and {fake.word()} normalization."
+        )
 
     def _generate_claims(self, method: str, dataset: str) -> list[dict[str, Any]]:
         """Generate paper claims."""
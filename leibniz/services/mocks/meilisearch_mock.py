@@ -1,7 +1,17 @@
 """Meilisearch mock for text search."""
 
+import heapq
+import re
+from collections import Counter
 from typing import Any
 
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _tokenize(text: str) -> list[str]:
+    """Split text into case-folded word tokens."""
+    return _TOKEN_RE.findall(text.casefold())
+
 
 class MeilisearchMock:
     """Mock Meilisearch client."""
@@ -19,7 +29,18 @@ class MeilisearchMock:
 
 
 class MeilisearchIndexMock:
-    """Mock Meilisearch index."""
+    """Mock Meilisearch index.
+
+    Searches are scored against an inverted index of title and abstract
+    tokens. Only exact, case-insensitive token matches count: unlike real
+    Meilisearch there is no prefix or typo matching, so "transformer" does
+    not match "Transformers".
+
+    Before each search the index catches up with ``documents``: appended
+    documents are indexed incrementally, and any indexed position that no
+    longer holds the same document object triggers a full rebuild. Editing an
+    already indexed document in place is not detected.
+    """
 
     def __init__(self) -> None:
         self.documents = [
@@ -38,28 +59,46 @@ class MeilisearchIndexMock:
                 "venue": "ICLR",
             },
         ]
+        self._index: dict[str, dict[int, int]] = {}
+        self._indexed_docs: list[dict[str, Any]] = []
+
+    def _sync_index(self) -> dict[str, dict[int, int]]:
+        """Index documents added since the last search, rebuilding if needed."""
+        docs = self.documents
+        indexed = self._indexed_docs
+        if len(docs) < len(indexed) or any(
+            doc is not seen for doc, seen in zip(docs, indexed, strict=False)
+        ):
+            self._index = {}
+            indexed.clear()
+
+        for pos in range(len(indexed), len(docs)):
+            doc = docs[pos]
+            tokens = Counter(_tokenize(f"{doc['title']} {doc['abstract']}"))
+            for token, count in tokens.items():
+                self._index.setdefault(token, {})[pos] = count
+            indexed.append(doc)
+        return self._index
 
     async def search(
         self, query: str, limit: int = 20, **_kwargs: Any
     ) -> dict[str, Any]:
         """Mock keyword search."""
-        query_lower = query.lower()
-        hits: list[dict[str, Any]] = []
-
-        for doc in self.documents:
-            score = 0
-            text = f"{doc['title']} {doc['abstract']}".lower()
-
-            for word in query_lower.split():
-                score += text.count(word)
+        index = self._sync_index()
 
-            if score > 0:
-                hits.append({**doc, "_score": score})
+        scores: Counter[int] = Counter()
+        for term in _tokenize(query):
+            for pos, count in index.get(term, {}).items():
+                scores[pos] += count
 
-        hits.sort(key=lambda x: x["_score"], reverse=True)
+        # Highest score first, ties in document order
+        top = heapq.nlargest(
+            limit, scores.items(), key=lambda item: (item[1], -item[0])
+        )
+        hits = [{**self.documents[pos], "_score": score} for pos, score in top]
 
         return {
-            "hits": hits[:limit],
+            "hits": hits,
             "processingTimeMs": 15,
             "query": query,
             "limit": limit,
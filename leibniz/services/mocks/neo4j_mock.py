@@ -1,6 +1,37 @@
 """Neo4j mock for graph queries."""
 
-from typing import Any
+from typing import Any, Final
+
+# Pre-populated test data, copied into each driver instance
+_PAPERS: Final[tuple[dict[str, Any], ...]] = (
+    {
+        "p.id": "test_p_1",
+        "p.title": "Efficient Transformers via Sparse Attention",
+        "p.year": 2023,
+        "p.venue": "NeurIPS",
+    },
+    {
+        "p.id": "test_p_2",
+        "p.title": "BERT Performance on SQuAD: A Critical Analysis",
+        "p.year": 2023,
+        "p.venue": "ICLR",
+    },
+)
+
+_CONTRADICTIONS: Final[tuple[dict[str, Any], ...]] = (
+    {
+        "p1.id": "test_p_1",
+        "p2.id": "test_p_2",
+        "c.claim": "BERT F1 score on SQuAD",
+        "c.delta": 2.8,
+    },
+)
+
+# Query dispatch table checked in order: (required substrings, mock_data key)
+_DISPATCH: Final[tuple[tuple[tuple[str, ...], str], ...]] = (
+    (("MATCH (p:Paper)", "CONTRADICTS"), "contradictions"),
+    (("MATCH (p:Paper)",), "papers"),
+)
 
 
 class Neo4jResult:
@@ -32,10 +63,9 @@ class Neo4jSession:
     async def run(self, query: str, **_params: Any) -> Neo4jResult:
         """Execute mock query."""
         # Simple pattern matching for common queries
-        if "MATCH (p:Paper)" in query and "CONTRADICTS" in query:
-            return Neo4jResult(self.mock_data.get("contradictions", []))
-        if "MATCH (p:Paper)" in query:
-            return Neo4jResult(self.mock_data.get("papers", []))
+        for needles, key in _DISPATCH:
+            if all(needle in query for needle in needles):
+                return Neo4jResult(self.mock_data.get(key, []))
         return Neo4jResult([])
 
     async def close(self) -> None:
@@ -46,30 +76,9 @@ class Neo4jDriverMock:
     """Mock Neo4j driver."""
 
     def __init__(self) -> None:
-        # Pre-populated test data
         self.mock_data = {
-            "papers": [
-                {
-                    "p.id": "test_p_1",
-                    "p.title": "Efficient Transformers via Sparse Attention",
-                    "p.year": 2023,
-                    "p.venue": "NeurIPS",
-                },
-                {
-                    "p.id": "test_p_2",
-                    "p.title": "BERT Performance on SQuAD: A Critical Analysis",
-                    "p.year": 2023,
-                    "p.venue": "ICLR",
-                },
-            ],
-            "contradictions": [
-                {
-                    "p1.id": "test_p_1",
-                    "p2.id": "test_p_2",
-                    "c.claim": "BERT F1 score on SQuAD",
-                    "c.delta": 2.8,
-                }
-            ],
+            "papers": [dict(record) for record in _PAPERS],
+            "contradictions": [dict(record) for record in _CONTRADICTIONS],
         }
 
     def session(self) -> Neo4jSession:
@@ -1,12 +1,26 @@
 """OpenAI API mock for embeddings and synthesis."""
 
 import asyncio
+import hashlib
+from collections import OrderedDict
 from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from typing import Any
 
 import numpy as np
 
+# Dimensionality of text-embedding-ada-002 vectors
+EMBEDDING_DIM = 1536
+
+# Most texts whose float32 embeddings are kept for reuse (about 6 KB each)
+_EMBEDDING_CACHE_SIZE = 4096
+
+
+def _seed(text: str) -> int:
+    """Derive a 32-bit RNG seed from text, stable across processes."""
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=4).digest()
+    return int.from_bytes(digest, "little")
+
 
 @dataclass
 class EmbeddingData:
@@ -41,7 +55,15 @@ class OpenAIMock:
 
 
 class EmbeddingsMock:
-    """Mock embeddings endpoint."""
+    """Mock embeddings endpoint.
+
+    Embeddings are deterministic per text, so the float32 vectors of the most
+    recently requested texts are kept in a bounded LRU cache. Each response
+    gets its own lists, so callers may mutate them freely.
+    """
+
+    def __init__(self) -> None:
+        self._cache: OrderedDict[str, np.ndarray] = OrderedDict()
 
     async def create(
         self, text_input: str | list[str], model: str = "text-embedding-ada-002"
@@ -50,11 +72,33 @@ class EmbeddingsMock:
         if isinstance(text_input, str):
             text_input = [text_input]
 
-        data = []
-        for idx, text in enumerate(text_input):
-            np.random.seed(hash(text) % 2**32)
-            embedding = np.random.randn(1536).tolist()
-            data.append(EmbeddingData(embedding=embedding, index=idx))
+        rows: dict[str, np.ndarray] = {}
+        missing = []
+        for text in dict.fromkeys(text_input):
+            cached = self._cache.get(text)
+            if cached is None:
+                missing.append(text)
+            else:
+                self._cache.move_to_end(text)
+                rows[text] = cached
+
+        if missing:
+            # One contiguous float32 buffer filled row by row from per-text
+            # generators, so results are deterministic without touching the
+            # global NumPy RNG.
+            vectors = np.empty((len(missing), EMBEDDING_DIM), dtype=np.float32)
+            for row, text in enumerate(missing):
+                rng = np.random.default_rng(_seed(text))
+                rng.standard_normal(dtype=np.float32, out=vectors[row])
+            for text, vector in zip(missing, vectors, strict=True):
+                rows[text] = self._cache[text] = vector.copy()
+            while len(self._cache) > _EMBEDDING_CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+        data = [
+            EmbeddingData(embedding=rows[text].tolist(), index=idx)
+            for idx, text in enumerate(text_input)
+        ]
 
         return EmbeddingResponse(
             data=data,
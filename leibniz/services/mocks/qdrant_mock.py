@@ -1,10 +1,47 @@
 """QDrant mock for vector search."""
 
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Final
 
 import numpy as np
 
+# Payloads for the test papers, copied into each client instance
+_PAPER_PAYLOADS: Final[dict[str, dict[str, Any]]] = {
+    "test_p_1": {
+        "paper_id": "test_p_1",
+        "title": "Efficient Transformers via Sparse Attention",
+        "abstract": "We propose sparse attention mechanisms...",
+        "year": 2023,
+        "venue": "NeurIPS",
+    },
+    "test_p_2": {
+        "paper_id": "test_p_2",
+        "title": "Quantization Methods for Transformer Models",
+        "abstract": "This paper explores quantization techniques...",
+        "year": 2023,
+        "venue": "ICLR",
+    },
+    "test_p_3": {
+        "paper_id": "test_p_3",
+        "title": "Knowledge Distillation in Large Language Models",
+        "abstract": "We present a novel distillation approach...",
+        "year": 2024,
+        "venue": "ICML",
+    },
+}
+
+
+def _quantize(vector: np.ndarray) -> tuple[np.ndarray, np.float32]:
+    """Quantize a vector to int8 with a symmetric per-vector scale."""
+    scale = np.float32(np.abs(vector).max() / 127) or np.float32(1)
+    return np.round(vector / scale).astype(np.int8), scale
+
+
+def _dequantize(quantized: np.ndarray, scale: np.float32) -> list[float]:
+    """Restore an approximate float vector from its int8 form."""
+    values: list[float] = (quantized.astype(np.float32) * scale).tolist()
+    return values
+
 
 @dataclass
 class ScoredPoint:
@@ -13,42 +50,25 @@ class ScoredPoint:
     id: str
     score: float
     payload: dict[str, Any]
+    vector: list[float] | None = None
 
 
 class QdrantMock:
     """Mock QDrant client."""
 
     def __init__(self, _host: str = "localhost", _port: int = 6333) -> None:
-        # Pre-computed embeddings for test papers
-        self.collections = {
+        # Random embeddings per instance for the test papers, stored as
+        # int8 plus a float32 scale to keep larger mock corpora small
+        rng = np.random.default_rng()
+        self.collections: dict[str, dict[str, dict[str, Any]]] = {
             "papers": {
                 "vectors": {
-                    "test_p_1": np.random.randn(1536).tolist(),
-                    "test_p_2": np.random.randn(1536).tolist(),
-                    "test_p_3": np.random.randn(1536).tolist(),
+                    paper_id: _quantize(rng.standard_normal(1536, dtype=np.float32))
+                    for paper_id in _PAPER_PAYLOADS
                 },
                 "payloads": {
-                    "test_p_1": {
-                        "paper_id": "test_p_1",
-                        "title": "Efficient Transformers via Sparse Attention",
-                        "abstract": "We propose sparse attention mechanisms...",
-                        "year": 2023,
-                        "venue": "NeurIPS",
-                    },
-                    "test_p_2": {
-                        "paper_id": "test_p_2",
-                        "title": "Quantization Methods for Transformer Models",
-                        "abstract": "This paper explores quantization techniques...",
-                        "year": 2023,
-                        "venue": "ICLR",
-                    },
-                    "test_p_3": {
-                        "paper_id": "test_p_3",
-                        "title": "Knowledge Distillation in Large Language Models",
-                        "abstract": "We present a novel distillation approach...",
-                        "year": 2024,
-                        "venue": "ICML",
-                    },
+                    paper_id: dict(payload)
+                    for paper_id, payload in _PAPER_PAYLOADS.items()
                 },
             }
         }
@@ -58,6 +78,7 @@ class QdrantMock:
         collection_name: str,
         query_vector: list[float],
         limit: int = 10,
+        with_vectors: bool = False,
         **_kwargs: Any,
     ) -> list[ScoredPoint]:
         """Mock vector search."""
@@ -75,11 +96,15 @@ class QdrantMock:
 
             # Fake relevance score based on query
             score = 0.95 - (idx * 0.1)
+            vector = (
+                _dequantize(*collection["vectors"][doc_id]) if with_vectors else None
+            )
             results.append(
                 ScoredPoint(
                     id=doc_id,
                     score=score,
                     payload=payload,
+                    vector=vector,
                 )
             )
 
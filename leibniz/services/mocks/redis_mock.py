@@ -1,42 +1,88 @@
 """Redis mock for testing without Redis server."""
 
-import asyncio
-from datetime import UTC, datetime, timedelta
+import heapq
+from time import monotonic_ns
 from typing import Any
 
+_NS_PER_SECOND = 1_000_000_000
+
+# Maximum expired keys evicted per write
+_SWEEP_LIMIT = 8
+
+# Rebuild the expiry heap once it holds this many entries per live key
+_HEAP_COMPACT_RATIO = 2
+
 
 class RedisMock:
-    """In-memory Redis mock with TTL support."""
+    """In-memory Redis mock with TTL support.
+
+    Operations never await while touching the store, so they are atomic with
+    respect to other coroutines on the same event loop and need no lock. The
+    mock is not safe to share across threads or event loops.
+
+    Expired keys are dropped when read, and writes also evict a bounded number
+    of expired keys so that keys which are never read do not accumulate.
+    """
 
     def __init__(self) -> None:
-        self._store: dict[str, tuple[str, datetime | None]] = {}
-        self._lock = asyncio.Lock()
+        # key -> (value, monotonic expiry in ns, 0 meaning no expiry)
+        self._store: dict[str, tuple[str, int]] = {}
+        # (expiry_ns, key) entries; stale once a key is rewritten or deleted
+        self._expiry_heap: list[tuple[int, str]] = []
 
     async def get(self, key: str) -> str | None:
         """Get value by key."""
-        async with self._lock:
-            if key in self._store:
-                value, expiry = self._store[key]
-                if expiry and datetime.now(UTC) > expiry:
-                    del self._store[key]
-                    return None
-                return value
-            return None
+        if key in self._store:
+            value, expiry_ns = self._store[key]
+            if expiry_ns and monotonic_ns() >= expiry_ns:
+                del self._store[key]
+                return None
+            return value
+        return None
 
     async def setex(self, key: str, ttl: int, value: str) -> bool:
         """Set value with TTL in seconds."""
-        async with self._lock:
-            expiry = datetime.now(UTC) + timedelta(seconds=ttl)
-            self._store[key] = (value, expiry)
-            return True
+        now_ns = monotonic_ns()
+        self._sweep(now_ns)
+        expiry_ns = now_ns + ttl * _NS_PER_SECOND
+        self._store[key] = (value, expiry_ns)
+        heapq.heappush(self._expiry_heap, (expiry_ns, key))
+        self._maybe_compact()
+        return True
+
+    def _maybe_compact(self) -> None:
+        """Rebuild the expiry heap once stale entries outnumber live keys."""
+        if (
+            len(self._expiry_heap)
+            > _HEAP_COMPACT_RATIO * len(self._store) + _SWEEP_LIMIT
+        ):
+            self._compact()
+
+    def _compact(self) -> None:
+        """Rebuild the expiry heap from live keys, dropping stale entries."""
+        self._expiry_heap = [
+            (expiry_ns, key) for key, (_, expiry_ns) in self._store.items() if expiry_ns
+        ]
+        heapq.heapify(self._expiry_heap)
+
+    def _sweep(self, now_ns: int) -> None:
+        """Evict up to ``_SWEEP_LIMIT`` keys whose expiry has passed."""
+        heap = self._expiry_heap
+        for _ in range(_SWEEP_LIMIT):
+            if not heap or heap[0][0] > now_ns:
+                return
+            expiry_ns, key = heapq.heappop(heap)
+            entry = self._store.get(key)
+            if entry is not None and entry[1] == expiry_ns:
+                del self._store[key]
 
     async def delete(self, key: str) -> int:
         """Delete key."""
-        async with self._lock:
-            if key in self._store:
-                del self._store[key]
-                return 1
-            return 0
+        if key in self._store:
+            del self._store[key]
+            self._maybe_compact()
+            return 1
+        return 0
 
     async def ping(self) -> bool:
         """Health check."""
@@ -1,28 +1,46 @@
 """Global pytest configuration and fixtures."""
 
+import itertools
 import os
+import time
 
 import pytest
+import pytest_asyncio
 
 # Force mocks in test environment
 os.environ["LEIBNIZ_USE_MOCKS"] = "true"
 
 from leibniz.services.mocks.factory import (
+    USE_MOCKS,
+    get_grobid_client,
     get_meilisearch_client,
     get_neo4j_driver,
     get_openai_client,
     get_qdrant_client,
     get_redis_client,
+    reset_clients,
 )
 
 
-@pytest.fixture
-async def redis_mock():
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Run every async test on the shared session event loop."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+# Mock clients are built once per session and shared by every test that
+# requests them; tests must not rely on a client starting out empty.
+
+
+@pytest.fixture(scope="session")
+def redis_mock():
     """Provide Redis mock."""
     return get_redis_client()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 async def neo4j_mock():
     """Provide Neo4j mock."""
     driver = get_neo4j_driver()
@@ -30,24 +48,54 @@ async def neo4j_mock():
     await driver.close()
 
 
-@pytest.fixture
-async def qdrant_mock():
+@pytest.fixture(scope="session")
+def qdrant_mock():
     """Provide QDrant mock."""
     return get_qdrant_client()
 
 
-@pytest.fixture
-async def meilisearch_mock():
+@pytest.fixture(scope="session")
+def meilisearch_mock():
     """Provide Meilisearch mock."""
     return get_meilisearch_client()
 
 
-@pytest.fixture
-async def openai_mock():
+@pytest.fixture(scope="session")
+def openai_mock():
     """Provide OpenAI mock."""
     return get_openai_client()
 
 
+@pytest.fixture(scope="session")
+def grobid_mock():
+    """Provide GROBID mock."""
+    return get_grobid_client()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _assert_mock_mode():
+    """Fail the session early unless the factory is in mock mode."""
+    assert os.environ.get("LEIBNIZ_USE_MOCKS") == "true"
+    assert USE_MOCKS is True
+    return USE_MOCKS
+
+
+@pytest.fixture(autouse=True)
+def _reset_factory_clients():
+    """Give each test fresh clients from direct factory getter calls."""
+    yield
+    reset_clients()
+
+
+@pytest.fixture
+def frozen_clock(monkeypatch):
+    """Replace the Redis mock clock with one that jumps 3601 s per reading."""
+    ticks = itertools.count(start=time.monotonic_ns(), step=3601 * 1_000_000_000)
+    monkeypatch.setattr(
+        "leibniz.services.mocks.redis_mock.monotonic_ns", lambda: next(ticks)
+    )
+
+
 @pytest.fixture
 def anyio_backend() -> str:
     """Use asyncio for async tests."""
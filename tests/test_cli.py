@@ -0,0 +1,65 @@
+"""Tests for the command-line interface."""
+
+import socket
+import subprocess
+import sys
+from collections.abc import Iterator
+
+import pytest
+
+from leibniz import cli
+
+UNRESOLVABLE_HOST = "unresolvable.invalid"
+
+
+@pytest.fixture
+def listening_port() -> Iterator[int]:
+    """Port of a local socket accepting connections."""
+    with socket.create_server(("127.0.0.1", 0)) as server:
+        yield server.getsockname()[1]
+
+
+@pytest.fixture
+def closed_port() -> int:
+    """Port on which nothing is listening."""
+    with socket.create_server(("127.0.0.1", 0)) as server:
+        return server.getsockname()[1]
+
+
+@pytest.fixture
+def fake_resolver(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Resolve every host to localhost except ``UNRESOLVABLE_HOST``."""
+
+    def gethostbyname(host: str) -> str:
+        if host == UNRESOLVABLE_HOST:
+            raise socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+        return "127.0.0.1"
+
+    monkeypatch.setattr(socket, "gethostbyname", gethostbyname)
+
+
+@pytest.mark.usefixtures("fake_resolver")
+def test_check_services_reports_in_order(
+    listening_port: int, closed_port: int, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Each service is reported once, in the order it was listed."""
+    cli._check_services(
+        [
+            ("Down", "localhost", closed_port),
+            ("Missing", UNRESOLVABLE_HOST, 1),
+            ("Up", "localhost", listening_port),
+        ]
+    )
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines == [
+        f"✗ Down is not accessible on port {closed_port}",
+        "✗ Missing check failed: [Errno -2] Name or service not known",
+        f"✓ Up is accessible on port {listening_port}",
+    ]
+
+
+def test_cli_import_defers_asyncio() -> None:
+    """Importing the CLI does not load asyncio."""
+    code = "import sys, leibniz.cli; assert 'asyncio' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
@@ -0,0 +1,61 @@
+"""Tests for configuration management."""
+
+import subprocess
+import sys
+
+import pytest
+
+from leibniz import config
+from leibniz.config import Settings, XDGPaths, get_settings
+
+
+def test_get_settings_is_cached() -> None:
+    """Repeated calls return the same settings instance."""
+    get_settings.cache_clear()
+    settings = get_settings()
+
+    assert isinstance(settings, Settings)
+    assert get_settings() is settings
+
+
+def test_get_settings_cache_clear() -> None:
+    """Clearing the cache builds a fresh settings instance."""
+    settings = get_settings()
+    get_settings.cache_clear()
+
+    assert get_settings() is not settings
+
+
+def test_settings_import_is_deferred() -> None:
+    """Importing the config package does not load pydantic-settings."""
+    code = (
+        "import sys, leibniz.config; "
+        "assert 'pydantic_settings' not in sys.modules; "
+        "leibniz.config.Settings; "
+        "assert 'pydantic_settings' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+
+
+def test_unknown_attribute_raises() -> None:
+    """Module-level lazy lookup only resolves known names."""
+    with pytest.raises(AttributeError):
+        _ = config.NotASetting
+
+
+def test_ensure_directories_runs_once(tmp_path, monkeypatch) -> None:
+    """Directories are created on first call and not re-created afterwards."""
+    for var in ("CONFIG", "DATA", "CACHE", "STATE"):
+        monkeypatch.setenv(f"XDG_{var}_HOME", str(tmp_path / var.lower()))
+    xdg = XDGPaths()
+
+    xdg.ensure_directories()
+    assert xdg.pdfs_dir.is_dir()
+
+    xdg.pdfs_dir.rmdir()
+    xdg.ensure_directories()
+    assert not xdg.pdfs_dir.exists()
+
+    xdg.reset()
+    xdg.ensure_directories()
+    assert xdg.pdfs_dir.is_dir()
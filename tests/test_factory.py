@@ -1,50 +1,43 @@
 """Tests for the mock factory."""
 
-import os
+import importlib
 
+import pytest
 
-def test_factory_uses_mocks_in_test_environment() -> None:
-    """Verify mocks are used in test environment."""
-    assert os.getenv("LEIBNIZ_USE_MOCKS") == "true"
+from leibniz.services.mocks import factory
+from leibniz.services.mocks.factory import (
+    get_meilisearch_client,
+    get_openai_client,
+    get_qdrant_client,
+    get_redis_client,
+)
+from leibniz.services.mocks.openai_mock import OpenAIMock
 
-    from leibniz.services.mocks.factory import USE_MOCKS
 
-    assert USE_MOCKS is True
+@pytest.mark.parametrize(
+    ("getter_name", "cls_path"),
+    [
+        ("get_redis_client", "leibniz.services.mocks.redis_mock:RedisMock"),
+        ("get_neo4j_driver", "leibniz.services.mocks.neo4j_mock:Neo4jDriverMock"),
+        ("get_qdrant_client", "leibniz.services.mocks.qdrant_mock:QdrantMock"),
+        (
+            "get_meilisearch_client",
+            "leibniz.services.mocks.meilisearch_mock:MeilisearchMock",
+        ),
+        ("get_openai_client", "leibniz.services.mocks.openai_mock:OpenAIMock"),
+        ("get_grobid_client", "leibniz.services.mocks.grobid_mock:GrobidMock"),
+    ],
+)
+def test_factory_returns_mock(getter_name: str, cls_path: str) -> None:
+    """Test that each factory getter returns its mock class."""
+    module_name, cls_name = cls_path.split(":")
+    mock_cls = getattr(importlib.import_module(module_name), cls_name)
 
-
-def test_factory_returns_mocks() -> None:
-    """Test that factory returns mock instances."""
-    from leibniz.services.mocks.factory import (
-        get_grobid_client,
-        get_meilisearch_client,
-        get_neo4j_driver,
-        get_openai_client,
-        get_qdrant_client,
-        get_redis_client,
-    )
-    from leibniz.services.mocks.grobid_mock import GrobidMock
-    from leibniz.services.mocks.meilisearch_mock import MeilisearchMock
-    from leibniz.services.mocks.neo4j_mock import Neo4jDriverMock
-    from leibniz.services.mocks.openai_mock import OpenAIMock
-    from leibniz.services.mocks.qdrant_mock import QdrantMock
-    from leibniz.services.mocks.redis_mock import RedisMock
-
-    assert isinstance(get_redis_client(), RedisMock)
-    assert isinstance(get_neo4j_driver(), Neo4jDriverMock)
-    assert isinstance(get_qdrant_client(), QdrantMock)
-    assert isinstance(get_meilisearch_client(), MeilisearchMock)
-    assert isinstance(get_openai_client(), OpenAIMock)
-    assert isinstance(get_grobid_client(), GrobidMock)
+    assert isinstance(getattr(factory, getter_name)(), mock_cls)
 
 
 def test_factory_with_kwargs() -> None:
     """Test that factory passes kwargs correctly."""
-    from leibniz.services.mocks.factory import (
-        get_meilisearch_client,
-        get_qdrant_client,
-        get_redis_client,
-    )
-
     redis = get_redis_client(host="localhost", port=6379)
     assert redis is not None
 
@@ -53,3 +46,24 @@ def test_factory_with_kwargs() -> None:
 
     meili = get_meilisearch_client(url="http://localhost:7700", api_key="test")
     assert meili is not None
+
+
+def test_factory_caches_clients() -> None:
+    """Test that getters reuse clients per kwargs until reset."""
+    redis = get_redis_client()
+
+    assert get_redis_client() is redis
+    assert get_redis_client(host="localhost") is not redis
+
+    factory.reset_clients()
+    assert get_redis_client() is not redis
+
+
+def test_factory_accepts_unhashable_kwargs() -> None:
+    """Test that unhashable kwargs build a fresh, uncached mock."""
+    headers = {"X-A": "b"}
+
+    openai = get_openai_client(api_key="x", default_headers=headers)
+
+    assert isinstance(openai, OpenAIMock)
+    assert get_openai_client(api_key="x", default_headers=headers) is not openai
@@ -1,33 +1,215 @@
+import asyncio
+import random
+
+import numpy as np
 import pytest
 
-from leibniz.services.mocks.factory import get_qdrant_client, get_redis_client
+from leibniz.services.mocks import fixtures
+from leibniz.services.mocks.meilisearch_mock import MeilisearchIndexMock
+from leibniz.services.mocks.qdrant_mock import QdrantMock, _dequantize, _quantize
+from leibniz.services.mocks.redis_mock import RedisMock
 
+QUERY_VECTOR = [0.1] * 1536
 
-@pytest.mark.asyncio
-async def test_redis_mock() -> None:
-    """Test Redis mock functionality."""
-    redis = get_redis_client()
 
+async def _redis_scenario(redis) -> None:
+    """Exercise Redis mock set and get."""
     await redis.setex("test_key", 3600, "test_value")
     value = await redis.get("test_key")
     assert value == "test_value"
 
-    await redis.setex("expire_key", 0, "value")
-    value = await redis.get("expire_key")
-    assert value is None
-
-
-@pytest.mark.asyncio
-async def test_qdrant_mock() -> None:
-    """Test QDrant mock search."""
-    qdrant = get_qdrant_client()
 
+async def _qdrant_scenario(qdrant) -> None:
+    """Exercise QDrant mock search."""
     results = await qdrant.search(
         collection_name="papers",
-        query_vector=[0.1] * 1536,
+        query_vector=QUERY_VECTOR,
         limit=5,
     )
 
     assert len(results) <= 5
     assert all(hasattr(r, "score") for r in results)
     assert all(hasattr(r, "payload") for r in results)
+
+
+async def test_mocks_concurrent(redis_mock, qdrant_mock) -> None:
+    """Test Redis and QDrant mocks side by side on one event loop."""
+    await asyncio.gather(_redis_scenario(redis_mock), _qdrant_scenario(qdrant_mock))
+
+
+@pytest.mark.usefixtures("frozen_clock")
+async def test_redis_mock_expiry() -> None:
+    """Test Redis mock keys expire once their TTL has elapsed."""
+    redis = RedisMock()
+
+    await redis.setex("expire_key", 3600, "value")
+    assert await redis.get("expire_key") is None
+
+
+async def test_openai_embeddings_mock(openai_mock) -> None:
+    """Test OpenAI mock embeddings are deterministic per text."""
+    response = await openai_mock.embeddings.create(["alpha", "beta", "alpha"])
+
+    assert [d.index for d in response.data] == [0, 1, 2]
+    assert all(len(d.embedding) == 1536 for d in response.data)
+    assert response.data[0].embedding == response.data[2].embedding
+    assert response.data[0].embedding != response.data[1].embedding
+
+    again = await openai_mock.embeddings.create("alpha")
+    assert again.data[0].embedding == response.data[0].embedding
+    assert again.data[0].embedding is not response.data[0].embedding
+
+    # Seeds do not depend on PYTHONHASHSEED, so values are stable across runs
+    assert response.data[0].embedding[:3] == pytest.approx(
+        [0.901035726, 1.555170894, 0.381293684]
+    )
+
+
+async def test_meilisearch_mock() -> None:
+    """Test Meilisearch mock keyword search and document addition."""
+    index = MeilisearchIndexMock()
+
+    results = await index.search("quantization transformer sparse")
+    assert [hit["id"] for hit in results["hits"]] == ["test_p_2", "test_p_1"]
+    assert results["hits"][0]["_score"] > results["hits"][1]["_score"]
+
+    index.add_documents(
+        [{"id": "new", "title": "Quantization", "abstract": "quantization"}]
+    )
+    results = await index.search("quantization", limit=1)
+    assert [hit["id"] for hit in results["hits"]] == ["test_p_2"]
+
+    results = await index.search("SPARSE")
+    assert [hit["id"] for hit in results["hits"]] == ["test_p_1"]
+
+    results = await index.search("nonexistent")
+    assert results["hits"] == []
+
+
+async def test_meilisearch_mock_tracks_direct_document_changes() -> None:
+    """Test the index follows documents appended, removed, replaced or reassigned."""
+    index = MeilisearchIndexMock()
+    await index.search("warmup")
+
+    index.documents.append({"id": "new", "title": "Pruning", "abstract": ""})
+    results = await index.search("pruning")
+    assert [hit["id"] for hit in results["hits"]] == ["new"]
+
+    index.documents.pop()
+    assert (await index.search("pruning"))["hits"] == []
+
+    index.documents.pop()
+    index.documents.append({"id": "swap", "title": "Distillation", "abstract": ""})
+    assert (await index.search("quantization"))["hits"] == []
+    results = await index.search("distillation")
+    assert [hit["id"] for hit in results["hits"]] == ["swap"]
+
+    index.documents = [{"id": "only", "title": "Distillation", "abstract": ""}]
+    results = await index.search("distillation sparse")
+    assert [hit["id"] for hit in results["hits"]] == ["only"]
+
+
+async def test_redis_mock_sweeps_expired_keys() -> None:
+    """Test writes evict expired keys that are never read."""
+    redis = RedisMock()
+
+    for i in range(4):
+        await redis.setex(f"stale_{i}", 0, "value")
+    await redis.setex("fresh", 3600, "value")
+
+    assert await redis.get("fresh") == "value"
+    assert list(redis._store) == ["fresh"]
+
+
+async def test_redis_mock_heap_stays_bounded() -> None:
+    """Test rewriting and deleting keys does not grow the expiry heap."""
+    redis = RedisMock()
+
+    for _ in range(1000):
+        await redis.setex("key", 3600, "value")
+    for i in range(100):
+        await redis.setex(f"gone_{i}", 3600, "value")
+        await redis.delete(f"gone_{i}")
+
+    assert len(redis._expiry_heap) <= 2 * len(redis._store) + 8
+
+
+async def test_neo4j_mock(neo4j_mock) -> None:
+    """Test Neo4j mock query dispatch."""
+    session = neo4j_mock.session()
+
+    papers = [r async for r in await session.run("MATCH (p:Paper) RETURN p")]
+    assert [r["p.id"] for r in papers] == ["test_p_1", "test_p_2"]
+
+    contradictions = [
+        r
+        async for r in await session.run(
+            "MATCH (p:Paper)-[c:CONTRADICTS]->(q:Paper) RETURN c"
+        )
+    ]
+    assert contradictions[0]["c.claim"] == "BERT F1 score on SQuAD"
+
+    assert [r async for r in await session.run("MATCH (a:Author) RETURN a")] == []
+
+    await session.close()
+
+
+def test_generate_dataset() -> None:
+    """Test bulk-generated papers have valid fields."""
+    generator = fixtures.TestDataGenerator()
+
+    papers = generator.generate_dataset(50)
+
+    assert [p["id"] for p in papers] == [f"test_p_{i}" for i in range(50)]
+    for paper in papers:
+        assert isinstance(paper["year"], int)
+        assert 2020 <= paper["year"] <= 2024
+        assert paper["venue"] in generator.venues
+        assert 2 <= len(paper["authors"]) <= 6
+        claim = paper["claims"][0]
+        assert claim["metric"] in generator.metrics
+        assert 70 <= claim["value"] <= 99
+
+
+async def test_qdrant_mock_with_vectors(qdrant_mock) -> None:
+    """Test QDrant mock returns dequantized vectors on request."""
+    results = await qdrant_mock.search(
+        collection_name="papers",
+        query_vector=QUERY_VECTOR,
+        with_vectors=True,
+    )
+
+    assert all(len(r.vector) == 1536 for r in results)
+
+
+def test_qdrant_quantization_round_trip() -> None:
+    """Test int8 quantization stays within half a step of the original."""
+    vector = np.random.default_rng(0).standard_normal(1536, dtype=np.float32)
+
+    quantized, scale = _quantize(vector)
+    restored = np.array(_dequantize(quantized, scale))
+
+    assert quantized.dtype == np.int8
+    assert np.abs(restored - vector).max() <= scale / 2 + 1e-6
+
+
+async def test_qdrant_mock_payloads_are_per_instance() -> None:
+    """Test mutating a returned payload does not leak into other clients."""
+    results = await QdrantMock().search("papers", QUERY_VECTOR)
+    results[0].payload["title"] = "MUTATED"
+
+    fresh = await QdrantMock().search("papers", QUERY_VECTOR)
+    assert fresh[0].payload["title"] != "MUTATED"
+
+
+def test_generate_dataset_is_reproducible() -> None:
+    """Test seeding random and Faker reproduces the same dataset."""
+    generator = fixtures.TestDataGenerator()
+
+    datasets = []
+    for _ in range(2):
+        random.seed(0)
+        fixtures.fake.seed_instance(0)
+        datasets.append(generator.generate_dataset(10))
+
+    assert datasets[0] == datasets[1]